@@ -1,34 +1,207 @@
 """In-memory TTL cache for API responses."""
 
-from typing import Any, Optional, Tuple
+import gzip
+import hashlib
+import struct
+import time
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Tuple
 
-from cachetools import TTLCache
+import orjson
 
-from .config import CACHE_MAX_SIZE, CACHE_TTL_SECONDS
+from .config import (
+    CACHE_MAX_BYTES,
+    CACHE_TTL_SECONDS,
+    FINANCIALS_CACHE_MAX_BYTES,
+    GZIP_MIN_SIZE,
+    REDIS_URL,
+    TTL_POLICY,
+)
+from .timerwheel_cache import TimerWheelCache
 
-# Initialize the cache
-cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
 
+class CacheEntry(NamedTuple):
+    body: bytes  # JSON-encoded response body
+    etag: str  # Quoted strong validator derived from body
+    gzipped: Optional[bytes]  # gzip-encoded body, or None if body is too small
+    stale_at: float  # time.monotonic() after which the entry should be refreshed
 
-def get_cache_key(ticker: str, date: Optional[str] = None) -> Tuple[str, str]:
-    """Generate a cache key from ticker and optional date."""
-    return (ticker.upper(), date or "-")
 
+def _entry_size(entry: CacheEntry) -> int:
+    return len(entry.body) + len(entry.gzipped or b"")
 
-def get_cached(ticker: str, date: Optional[str] = None) -> Optional[Any]:
-    """Get cached data if available."""
-    if isinstance(ticker, str) and ticker.startswith("snapshot_"):
-        # Direct key for snapshot data
-        return cache.get(ticker)
-    key = get_cache_key(ticker, date)
-    return cache.get(key)
 
+# Entries may be served stale (while refreshed) for as long again as their TTL
+_STALE_TTL_FACTOR = 2
 
-def set_cached(ticker: str, data: Any, date: Optional[str] = None) -> None:
-    """Store data in cache."""
-    if isinstance(ticker, str) and ticker.startswith("snapshot_"):
-        # Direct key for snapshot data
-        cache[ticker] = data
-    else:
-        key = get_cache_key(ticker, date)
-        cache[key] = data
+# Initialize the caches, sized in body bytes
+overview_cache = TimerWheelCache(
+    maxsize=CACHE_MAX_BYTES,
+    ttl=TTL_POLICY["overview"] * _STALE_TTL_FACTOR,
+    getsizeof=_entry_size,
+)
+financials_cache = TimerWheelCache(
+    maxsize=FINANCIALS_CACHE_MAX_BYTES,
+    ttl=TTL_POLICY["financials"] * _STALE_TTL_FACTOR,
+    getsizeof=_entry_size,
+)
+CACHES = (overview_cache, financials_cache)
+
+# Shared L2 tier so uvicorn workers do not each miss on the same keys
+redis_client = None
+if REDIS_URL:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+
+    redis_client = aioredis.Redis.from_url(REDIS_URL)
+
+_L2_PREFIX = "cache:"
+# L2 values are (stale_at, expires_at) wall-clock times followed by the JSON body
+_L2_HEADER = struct.Struct("!dd")
+
+# Fill ratios between which TTLs shrink linearly, down to 20% at the high mark
+_PRESSURE_LOW = 0.7
+_PRESSURE_HIGH = 0.9
+_PRESSURE_MAX_CUT = 0.8
+
+
+def _route_cache(key: str) -> TimerWheelCache:
+    """Pick the cache bucket for a key based on its kind prefix."""
+    return financials_cache if key.startswith("financials:") else overview_cache
+
+
+def effective_ttl(base_ttl: float, cache: TimerWheelCache) -> float:
+    """Scale a TTL down as the cache fills so new entries make room sooner."""
+    fill = cache.currsize / cache.maxsize
+    pressure = (fill - _PRESSURE_LOW) / (_PRESSURE_HIGH - _PRESSURE_LOW)
+    pressure = max(0.0, min(1.0, pressure))
+    return base_ttl * (1 - pressure * _PRESSURE_MAX_CUT)
+
+
+def make_cache_key(kind: str, **params: Any) -> str:
+    """
+    Build a canonical cache key for a request kind and its parameters.
+
+    Parameters are serialized with sorted keys and hashed, so the key does not
+    depend on argument order and distinct parameter sets cannot collide.
+    """
+    material = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return f"{kind}:{hashlib.blake2b(material, digest_size=16).hexdigest()}"
+
+
+@lru_cache(maxsize=4096)
+def get_cache_key(ticker: str, date: Optional[str] = None) -> str:
+    """Generate the overview cache key for a ticker and optional date."""
+    return make_cache_key("overview", ticker=ticker.upper(), date=date)
+
+
+def serialize(data: Any) -> bytes:
+    """Encode a response payload to JSON bytes."""
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def make_etag(body: bytes) -> str:
+    """Derive a strong ETag from a serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def compress(body: bytes) -> Optional[bytes]:
+    """Gzip a serialized body, or return None if it is too small to be worth it."""
+    return gzip.compress(body) if len(body) >= GZIP_MIN_SIZE else None
+
+
+def _make_entry(body: bytes, stale_at: float) -> CacheEntry:
+    """Wrap a serialized body with its ETag and, if worthwhile, a gzipped copy."""
+    return CacheEntry(body, make_etag(body), compress(body), stale_at)
+
+
+async def _get_l2(cache: TimerWheelCache, key: str) -> Optional[CacheEntry]:
+    """Read an entry from Redis and repopulate the in-process cache with it."""
+    try:
+        raw = await redis_client.get(_L2_PREFIX + key)
+    except RedisError:
+        return None
+    if raw is None or len(raw) < _L2_HEADER.size:
+        return None
+    stale_at, expires_at = _L2_HEADER.unpack_from(raw)
+    wall_now, mono_now = time.time(), time.monotonic()
+    if expires_at <= wall_now:
+        return None
+    entry = _make_entry(raw[_L2_HEADER.size :], mono_now + (stale_at - wall_now))
+    cache.set(key, entry, expires_at - wall_now)
+    return entry
+
+
+async def _get(cache: TimerWheelCache, key: str) -> Tuple[Optional[CacheEntry], bool]:
+    entry = cache.get(key)
+    if entry is None and redis_client is not None:
+        entry = await _get_l2(cache, key)
+    if entry is None:
+        return None, False
+    return entry, time.monotonic() >= entry.stale_at
+
+
+async def get_cached_ticker(
+    ticker: str, date: Optional[str] = None
+) -> Tuple[Optional[CacheEntry], bool]:
+    """Get the cached overview for a ticker and whether it is due for a refresh."""
+    return await _get(overview_cache, get_cache_key(ticker, date))
+
+
+async def get_cached_raw(key: str) -> Tuple[Optional[CacheEntry], bool]:
+    """Get the cached entry for a composite key and whether it is due for a refresh."""
+    return await _get(_route_cache(key), key)
+
+
+async def _set(
+    cache: TimerWheelCache, key: str, data: Any, soft_ttl: Optional[float]
+) -> CacheEntry:
+    """
+    Serialize data and store it in cache, fresh for soft_ttl seconds and then
+    served stale for as long again.
+
+    Both the soft TTL and the hard expiry shrink under memory pressure
+    (see effective_ttl). When Redis is configured the entry is written
+    through to it as well.
+
+    Returns:
+        The cached entry, whose body is ready to send as a response
+    """
+    if soft_ttl is None:
+        soft_ttl = CACHE_TTL_SECONDS
+    ttl = effective_ttl(soft_ttl * _STALE_TTL_FACTOR, cache)
+    soft_ttl = effective_ttl(soft_ttl, cache)
+    body = serialize(data)
+    entry = _make_entry(body, time.monotonic() + soft_ttl)
+    cache.set(key, entry, ttl)
+    if redis_client is not None:
+        wall_now = time.time()
+        header = _L2_HEADER.pack(wall_now + soft_ttl, wall_now + ttl)
+        try:
+            await redis_client.set(_L2_PREFIX + key, header + body, px=int(ttl * 1000))
+        except RedisError:
+            pass
+    return entry
+
+
+async def set_cached_ticker(
+    ticker: str,
+    data: Any,
+    date: Optional[str] = None,
+    soft_ttl: Optional[float] = None,
+) -> CacheEntry:
+    """Cache a ticker overview payload and return the new entry."""
+    return await _set(overview_cache, get_cache_key(ticker, date), data, soft_ttl)
+
+
+async def set_cached_raw(
+    key: str, data: Any, soft_ttl: Optional[float] = None
+) -> CacheEntry:
+    """Cache a payload under a composite key and return the new entry."""
+    return await _set(_route_cache(key), key, data, soft_ttl)
+
+
+async def close() -> None:
+    """Close the Redis connection pool, if any."""
+    if redis_client is not None:
+        await redis_client.aclose()
@@ -1,7 +1,8 @@
 """Configuration settings for the Finance Dashboard API."""
 
 import os
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -10,12 +11,47 @@ load_dotenv()
 
 # Cache settings
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "21600"))  # 6 hours default
-CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+# Byte budgets for cached response bodies
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Financials get their own bucket so their many query variants cannot evict overviews
+FINANCIALS_CACHE_MAX_BYTES = int(
+    os.getenv("FINANCIALS_CACHE_MAX_BYTES", str(192 * 1024 * 1024))
+)
+# Financial statements change quarterly, so they stay fresh much longer
+FINANCIALS_CACHE_TTL_SECONDS = int(os.getenv("FINANCIALS_CACHE_TTL_SECONDS", "86400"))
+# Freshness per endpoint kind, also sent to clients as Cache-Control max-age
+TTL_POLICY: Mapping[str, int] = MappingProxyType(
+    {"overview": CACHE_TTL_SECONDS, "financials": FINANCIALS_CACHE_TTL_SECONDS}
+)
+# Responses at least this large are gzip-compressed (cached bodies ahead of time)
+GZIP_MIN_SIZE = 1024
+# Optional shared L2 cache, e.g. redis://localhost:6379/0 (unset: per-process only)
+REDIS_URL: Optional[str] = os.getenv("REDIS_URL") or None
+
+# Worker threads for blocking yfinance calls (I/O bound, so well above CPU count)
+YF_POOL_SIZE = int(os.getenv("YF_POOL_SIZE", "32"))
+
+# Tickers primed at startup and kept fresh in the background
+HOT_TICKERS: List[str] = [
+    t.strip().upper()
+    for t in os.getenv("HOT_TICKERS", "AAPL,MSFT,GOOGL,SPY,QQQ").split(",")
+    if t.strip()
+]
+HOT_TICKERS_REFRESH_SECONDS = int(
+    os.getenv("HOT_TICKERS_REFRESH_SECONDS", str(CACHE_TTL_SECONDS * 9 // 10))
+)
+
+# Request validation
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+BATCH_MAX_TICKERS = int(os.getenv("BATCH_MAX_TICKERS", "50"))
 
 # CORS settings
-ALLOWED_ORIGINS: List[str] = os.getenv(
-    "ALLOWED_ORIGINS", "http://localhost:3000"
-).split(",")
+# Normalized once into a set; CORSMiddleware only does membership checks on it
+ALLOWED_ORIGINS: FrozenSet[str] = frozenset(
+    origin.strip().lower()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+)
 
 
 class User(BaseModel):
@@ -36,3 +72,8 @@ USER_DB: Dict[str, User] = {
         role="user",
     ),
 }
+
+# Read-only index for O(1) lookups by email
+USER_BY_EMAIL: Mapping[str, User] = MappingProxyType(
+    {user.email: user for user in USER_DB.values()}
+)
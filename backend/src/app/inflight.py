@@ -0,0 +1,37 @@
+"""Single-flight upstream fetches and background revalidation."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Set
+
+# Upstream fetches currently in flight, keyed by cache key
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+# Background refreshes for stale entries; referenced so they are not GC'd mid-flight
+_revalidations: Set["asyncio.Task[Any]"] = set()
+
+
+async def fetch_once(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch for key, sharing a single upstream call among concurrent misses."""
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(fetch())
+        _inflight[key] = fut
+        fut.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one disconnecting client does not cancel the fetch for the rest.
+    return await asyncio.shield(fut)
+
+
+def _revalidation_done(task: "asyncio.Task[Any]") -> None:
+    _revalidations.discard(task)
+    if not task.cancelled():
+        # A failed refresh keeps serving the stale entry until its hard expiry.
+        task.exception()
+
+
+def revalidate(key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+    """Refresh a stale entry in the background unless a fetch is already running."""
+    if key in _inflight:
+        return
+    task = asyncio.create_task(fetch_once(key, fetch))
+    _revalidations.add(task)
+    task.add_done_callback(_revalidation_done)
@@ -0,0 +1,73 @@
+"""Responses built from cached, pre-serialized bodies."""
+
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows gzip (q=0 means refused)."""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            return q > 0
+        wildcard = q > 0
+    return wildcard
+
+
+def cached_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_status: str,
+    max_age: Optional[int],
+    gzipped: Optional[bytes] = None,
+) -> Response:
+    """
+    Build a JSON response from an already-serialized cache body.
+
+    Sends the precompressed body when one is given and the client accepts gzip,
+    and answers 304 Not Modified with no body when the client already holds it.
+    A max_age of None marks the response as not cacheable.
+    """
+    cache_control = "no-store" if max_age is None else f"public, max-age={max_age}"
+    headers = {"X-Cache": cache_status, "Cache-Control": cache_control}
+    if gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            body = gzipped
+            # Each encoding is a distinct representation and needs its own tag.
+            etag = etag[:-1] + '-gzip"'
+            headers["Content-Encoding"] = "gzip"
+        else:
+            # Mark the encoding as settled so GZipMiddleware, which only looks for
+            # "gzip" in Accept-Encoding, does not compress it under the plain tag.
+            headers["Content-Encoding"] = "identity"
+    headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1 @@
+"""API routers for the Finance Dashboard API."""
@@ -0,0 +1,81 @@
+"""Financial statement endpoints."""
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Query, Request
+
+from ..cache import get_cached_raw, make_cache_key, set_cached_raw
+from ..config import TTL_POLICY
+from ..inflight import fetch_once, revalidate
+from ..responses import cached_response
+from ..yfinance_client import get_financials as yf_get_financials
+
+router = APIRouter(prefix="/api", tags=["financials"])
+
+
+@router.get("/ticker/{ticker}/financials")
+async def get_ticker_financials(
+    request: Request,
+    ticker: str,
+    timeframe: Optional[Literal["annual", "quarterly", "ttm"]] = Query(
+        None, description="annual | quarterly | ttm"
+    ),
+    limit: int = Query(8, ge=1, le=100),
+    include_sources: bool = Query(False),
+    sort: Optional[str] = Query(None, description="Sort field for ordering"),
+    order: Optional[Literal["asc", "desc"]] = Query(None, description="asc | desc"),
+    filing_date: Optional[str] = Query(None, description="Filter by filing_date"),
+    period_of_report_date: Optional[str] = Query(
+        None, description="Filter by period_of_report_date"
+    ),
+):
+    """
+    Get financial statements for a ticker from Yahoo Finance with caching.
+    """
+    cache_key = make_cache_key(
+        "financials",
+        ticker=ticker.upper(),
+        timeframe=timeframe,
+        limit=limit,
+        include_sources=include_sources,
+        sort=sort,
+        order=order,
+        filing_date=filing_date,
+        period_of_report_date=period_of_report_date,
+    )
+
+    async def fetch():
+        data = await yf_get_financials(
+            ticker=ticker,
+            timeframe=timeframe,
+            limit=limit,
+            include_sources=include_sources,
+            sort=sort,
+            order=order,
+            filing_date=filing_date,
+            period_of_report_date=period_of_report_date,
+        )
+        return await set_cached_raw(cache_key, data, TTL_POLICY["financials"])
+
+    cached, is_stale = await get_cached_raw(cache_key)
+    if cached is not None:
+        if is_stale:
+            revalidate(cache_key, fetch)
+        return cached_response(
+            request,
+            cached.body,
+            cached.etag,
+            "STALE" if is_stale else "HIT",
+            TTL_POLICY["financials"],
+            cached.gzipped,
+        )
+
+    entry = await fetch_once(cache_key, fetch)
+    return cached_response(
+        request,
+        entry.body,
+        entry.etag,
+        "MISS",
+        TTL_POLICY["financials"],
+        entry.gzipped,
+    )
@@ -0,0 +1,156 @@
+"""Ticker overview endpoints."""
+
+import asyncio
+from functools import partial
+from typing import Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from ..cache import (
+    CacheEntry,
+    compress,
+    get_cache_key,
+    get_cached_ticker,
+    make_etag,
+    serialize,
+    set_cached_ticker,
+)
+from ..config import (
+    BATCH_MAX_TICKERS,
+    DATE_PATTERN,
+    HOT_TICKERS,
+    HOT_TICKERS_REFRESH_SECONDS,
+    TTL_POLICY,
+)
+from ..inflight import fetch_once, revalidate
+from ..responses import cached_response
+from ..yfinance_client import get_ticker_overview as yf_get_ticker_overview
+
+router = APIRouter(prefix="/api", tags=["tickers"])
+
+
+async def _load_overview(ticker: str, date: Optional[str] = None) -> CacheEntry:
+    """Fetch a ticker overview from yfinance and cache its serialized body."""
+    data = await yf_get_ticker_overview(ticker, date)
+    return await set_cached_ticker(ticker, data, date, TTL_POLICY["overview"])
+
+
+async def warm_hot_tickers() -> None:
+    """Prime overviews for HOT_TICKERS, then re-fetch them before they go stale."""
+    while True:
+        await asyncio.gather(
+            *(
+                fetch_once(get_cache_key(ticker), partial(_load_overview, ticker))
+                for ticker in HOT_TICKERS
+            ),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(HOT_TICKERS_REFRESH_SECONDS)
+
+
+@router.get("/ticker/{ticker}")
+async def get_ticker_overview(
+    request: Request,
+    ticker: str,
+    date: Optional[str] = Query(
+        None, pattern=DATE_PATTERN, description="Date in YYYY-MM-DD format"
+    ),
+):
+    """
+    Get ticker overview data from Yahoo Finance with caching.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., AAPL, MSFT)
+        date: Optional date in YYYY-MM-DD format (ignored; yfinance returns current data)
+
+    Returns:
+        Ticker overview data
+    """
+    cache_key = get_cache_key(ticker, date)
+    fetch = partial(_load_overview, ticker, date)
+
+    cached, is_stale = await get_cached_ticker(ticker, date)
+    if cached is not None:
+        if is_stale:
+            revalidate(cache_key, fetch)
+        return cached_response(
+            request,
+            cached.body,
+            cached.etag,
+            "STALE" if is_stale else "HIT",
+            TTL_POLICY["overview"],
+            cached.gzipped,
+        )
+
+    entry = await fetch_once(cache_key, fetch)
+    return cached_response(
+        request,
+        entry.body,
+        entry.etag,
+        "MISS",
+        TTL_POLICY["overview"],
+        entry.gzipped,
+    )
+
+
+@router.get("/tickers")
+async def get_tickers_overview(
+    request: Request,
+    symbols: str = Query(..., description="Comma-separated tickers, e.g. AAPL,MSFT"),
+):
+    """
+    Get overview data for several tickers in one request.
+
+    Cached overviews are served as-is; misses are fetched concurrently and cached
+    per ticker, so later single-ticker requests for them are hits.
+
+    Args:
+        symbols: Comma-separated stock ticker symbols
+
+    Returns:
+        Object mapping each ticker to its overview data, or to {"error": ...}
+    """
+    tickers = list(
+        dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip())
+    )
+    if not tickers or len(tickers) > BATCH_MAX_TICKERS:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": f"Provide between 1 and {BATCH_MAX_TICKERS} symbols"},
+        )
+
+    cached = await asyncio.gather(*(get_cached_ticker(t) for t in tickers))
+    bodies: Dict[str, bytes] = {}
+    misses = []
+    for ticker, (entry, is_stale) in zip(tickers, cached):
+        if entry is None:
+            misses.append(ticker)
+            continue
+        if is_stale:
+            revalidate(get_cache_key(ticker), partial(_load_overview, ticker))
+        bodies[ticker] = entry.body
+
+    fetched = await asyncio.gather(
+        *(fetch_once(get_cache_key(t), partial(_load_overview, t)) for t in misses),
+        return_exceptions=True,
+    )
+    failed = False
+    for ticker, result in zip(misses, fetched):
+        if isinstance(result, Exception):
+            failed = True
+            bodies[ticker] = serialize({"error": str(result)})
+        else:
+            bodies[ticker] = result.body
+
+    # Splice the cached bodies into one JSON object without re-encoding them.
+    body = b"{%b}" % b",".join(serialize(t) + b":" + bodies[t] for t in tickers)
+    # Compress here rather than in GZipMiddleware so the gzipped body gets its own
+    # ETag, and never let clients cache a response carrying per-ticker errors.
+    return cached_response(
+        request,
+        body,
+        make_etag(body),
+        "MISS" if misses else "HIT",
+        None if failed else TTL_POLICY["overview"],
+        compress(body),
+    )
@@ -0,0 +1,20 @@
+"""User lookup endpoints."""
+
+from fastapi import APIRouter, HTTPException
+
+from ..config import USER_BY_EMAIL, User
+
+router = APIRouter(prefix="/api", tags=["user"])
+
+
+@router.get("/user/{email}")
+async def get_user_by_email(email: str) -> User:
+    """
+    Get user by email from the user database.
+    """
+    user = USER_BY_EMAIL.get(email)
+    if user is None:
+        raise HTTPException(
+            status_code=404, detail={"error": f"No user found for {email}"}
+        )
+    return user
@@ -0,0 +1,190 @@
+"""Hierarchical timer-wheel cache with per-entry TTL and amortized O(1) expiry."""
+
+import asyncio
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+_NS_PER_TICK = 1_000_000_000  # one tick per second
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+# Each level spans 64x the previous one: 1s, 64s, 4096s, 262144s per slot.
+_SHIFTS = tuple(_SLOT_BITS * level for level in range(_LEVELS + 1))
+
+
+class TimerWheelCache:
+    """
+    Dict-like TTL cache backed by a 4-level timer wheel (64 slots per level).
+
+    Values live in a plain dict as `(value, expiry_ns, size)`; the wheel only
+    holds `(key, expiry_ns)` records used to reclaim memory once entries
+    expire. Reads check the expiry timestamp directly, so a hit or miss never
+    touches the wheel. Call `expire()` periodically (or run `run()` as a task)
+    to advance the wheel one slot per elapsed second.
+
+    Like cachetools, `maxsize` bounds the sum of `getsizeof(value)` over all
+    entries (each entry counts as 1 by default); least recently used entries
+    are evicted to make room.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.currsize = 0
+        self._getsizeof = getsizeof
+        self._data: Dict[Hashable, Tuple[Any, int, int]] = {}
+        self._wheels: List[List[Deque[Tuple[Hashable, int]]]] = [
+            [deque() for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        # Next tick whose level-0 slot has not been processed yet.
+        self._tick = time.monotonic_ns() // _NS_PER_TICK + 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[1] > time.monotonic_ns()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.currsize -= self._data.pop(key)[2]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[1] <= time.monotonic_ns():
+            del self._data[key]
+            self.currsize -= entry[2]
+            return default
+        # Re-insert so dict order doubles as LRU order for eviction.
+        del self._data[key]
+        self._data[key] = entry
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds (defaults to self.ttl)."""
+        size = self._getsizeof(value) if self._getsizeof is not None else 1
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.currsize -= old[2]
+        if size > self.maxsize:
+            # Too large to ever fit; leave it uncached rather than flush everything.
+            return
+        while self.currsize + size > self.maxsize:
+            # Evict the least recently used entry; its wheel record goes stale.
+            self.currsize -= self._data.pop(next(iter(self._data)))[2]
+        expiry_ns = time.monotonic_ns() + int(
+            (self.ttl if ttl is None else ttl) * _NS_PER_TICK
+        )
+        self._data[key] = (value, expiry_ns, size)
+        self.currsize += size
+        self._schedule(key, expiry_ns)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its live value, or default."""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        self.currsize -= entry[2]
+        if entry[1] <= time.monotonic_ns():
+            return default
+        return entry[0]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.currsize = 0
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+
+    def _schedule(self, key: Hashable, expiry_ns: int) -> None:
+        """Place a wheel record in the lowest level whose span covers the expiry."""
+        expiry_tick = max(-(-expiry_ns // _NS_PER_TICK), self._tick)
+        level = 0
+        while (
+            level < _LEVELS - 1
+            and expiry_tick >> _SHIFTS[level + 1] != self._tick >> _SHIFTS[level + 1]
+        ):
+            level += 1
+        slot = (expiry_tick >> _SHIFTS[level]) & _SLOT_MASK
+        self._wheels[level][slot].append((key, expiry_ns))
+
+    def expire(self, now_ns: Optional[int] = None) -> None:
+        """Advance the wheel to now, dropping every entry that has expired."""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        target = now_ns // _NS_PER_TICK
+        data = self._data
+        if target - self._tick >= 1 << _SHIFTS[_LEVELS]:
+            # Fell behind by more than a full revolution: rebuild instead of ticking.
+            self._rebuild(now_ns, target + 1)
+            return
+        while self._tick <= target:
+            tick = self._tick
+            # Cascade higher-level slots whose span starts at this tick.
+            for level in range(_LEVELS - 1, 0, -1):
+                if tick & ((1 << _SHIFTS[level]) - 1) == 0:
+                    bucket = self._wheels[level][(tick >> _SHIFTS[level]) & _SLOT_MASK]
+                    records = list(bucket)
+                    bucket.clear()
+                    for key, expiry_ns in records:
+                        entry = data.get(key)
+                        if entry is not None and entry[1] == expiry_ns:
+                            self._schedule(key, expiry_ns)
+            bucket = self._wheels[0][tick & _SLOT_MASK]
+            while bucket:
+                key, expiry_ns = bucket.popleft()
+                entry = data.get(key)
+                if entry is not None and entry[1] == expiry_ns:
+                    del data[key]
+                    self.currsize -= entry[2]
+            self._tick = tick + 1
+
+    def _rebuild(self, now_ns: int, tick: int) -> None:
+        live = {k: e for k, e in self._data.items() if e[1] > now_ns}
+        self.clear()
+        self._data.update(live)
+        self.currsize = sum(e[2] for e in live.values())
+        self._tick = tick
+        for key, (_, expiry_ns, _) in live.items():
+            self._schedule(key, expiry_ns)
+
+    async def run(self, interval: float = 1.0) -> None:
+        """Advance the wheel every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self.expire()
+
+
+_MISSING = object()
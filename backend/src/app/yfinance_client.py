@@ -1,11 +1,39 @@
 """yfinance client for stock data (no API key required)."""
 
 import asyncio
+import atexit
+import heapq
+import math
 import re
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import yfinance as yf
 
+from .config import YF_POOL_SIZE
+
+# Dedicated pool so bursts of Yahoo calls do not queue behind the default executor
+_YF_EXECUTOR = ThreadPoolExecutor(max_workers=YF_POOL_SIZE, thread_name_prefix="yf")
+atexit.register(_YF_EXECUTOR.shutdown, wait=False)
+
+_DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+# Word boundaries for _to_snake: lower/digit -> Upper, or any char -> Capitalized
+_SNAKE_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])")
+_SNAKE_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+# Calendar quarter for each month, indexed by month - 1
+_MONTH_TO_Q = ("Q1",) * 3 + ("Q2",) * 3 + ("Q3",) * 3 + ("Q4",) * 3
+
+
+class TickerNotFoundError(ValueError):
+    """Raised when Yahoo Finance has no data for a ticker."""
+
+
+class UpstreamError(RuntimeError):
+    """Raised when a Yahoo Finance request fails."""
+
 
 def _domain_from_url(url: Optional[str]) -> Optional[str]:
     """Extract domain from URL for Clearbit logo (e.g. https://www.apple.com -> apple.com)."""
@@ -14,7 +42,7 @@ def _domain_from_url(url: Optional[str]) -> Optional[str]:
     url = url.strip().lower()
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
-    match = re.search(r"https?://(?:www\.)?([^/]+)", url)
+    match = _DOMAIN_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -24,46 +52,52 @@ def _clearbit_logo_url(website: Optional[str]) -> Optional[str]:
     return f"https://logo.clearbit.com/{domain}" if domain else None
 
 
+@lru_cache(maxsize=4096)
 def _to_snake(key: str) -> str:
-    """Convert camelCase or Title Case to snake_case."""
-    s = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
-    return (
-        re.sub("([a-z0-9])([A-Z])", r"\1_\2", s)
-        .lower()
-        .replace(" ", "_")
-        .replace("-", "_")
-    )
+    """Convert camelCase or Title Case to snake_case (memoized; labels repeat)."""
+    return _SNAKE_BOUNDARY_RE.sub("_", key).translate(_SNAKE_SEPARATORS).lower()
 
 
 def _safe_float(val: Any) -> Optional[float]:
     """Convert to float, return None for NaN/inf."""
+    # Fast path for statement cells, which are almost always (numpy) floats.
+    if isinstance(val, float):
+        return float(val) if math.isfinite(val) else None
     if val is None:
         return None
     try:
         f = float(val)
-        if f != f or abs(f) == float("inf"):  # NaN or inf
-            return None
-        return f
     except (TypeError, ValueError):
         return None
-
-
-def _series_to_statement(series: Any) -> Dict[str, Dict[str, Any]]:
-    """Convert a pandas Series (index=row names, values=numbers) to statement dict."""
-    statement: Dict[str, Dict[str, Any]] = {}
-    if series is None:
-        return statement
-    try:
-        for idx in series.index:
-            val = series.loc[idx]
-            num_val = _safe_float(val)
-            if num_val is None:
-                continue
-            key = _to_snake(str(idx))
-            statement[key] = {"value": num_val, "unit": "USD", "label": str(idx)}
-    except Exception:
-        pass
-    return statement
+    return f if math.isfinite(f) else None
+
+
+def _first_statement(t: Any, names: Tuple[str, ...]) -> Any:
+    """Return the first non-empty statement DataFrame among t's attributes."""
+    for name in names:
+        df = getattr(t, name, None)
+        if df is not None and not df.empty:
+            return df
+    return None
+
+
+def _df_to_by_col(df: Any) -> Dict[Any, Dict[str, Dict[str, Any]]]:
+    """Convert a statement DataFrame (rows=line items) to {column: statement dict}."""
+    by_col: Dict[Any, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    if df is None or df.empty:
+        return by_col
+    # One C-level pass flattens the frame to (row, column) -> value without NaNs.
+    for (row, col), val in df.stack(future_stack=True).dropna().items():
+        num_val = _safe_float(val)
+        if num_val is None:
+            continue
+        label = str(row)
+        by_col[col][_to_snake(label)] = {
+            "value": num_val,
+            "unit": "USD",
+            "label": label,
+        }
+    return by_col
 
 
 async def get_ticker_overview(
@@ -80,8 +114,10 @@ async def get_ticker_overview(
         Dict with status and results matching frontend expectations
     """
 
+    sym = ticker.upper()
+
     def _fetch():
-        t = yf.Ticker(ticker.upper())
+        t = yf.Ticker(sym)
         info = t.info
         if not info:
             return None
@@ -93,8 +129,8 @@ async def get_ticker_overview(
         return {
             "status": "OK",
             "results": {
-                "ticker": info.get("symbol", ticker.upper()),
-                "name": info.get("longName") or info.get("shortName") or ticker.upper(),
+                "ticker": info.get("symbol") or sym,
+                "name": info.get("longName") or info.get("shortName") or sym,
                 "market": info.get("market", "stocks"),
                 "locale": "us",
                 "primary_exchange": info.get("exchange", "N/A"),
@@ -112,13 +148,77 @@ async def get_ticker_overview(
             },
         }
 
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, _fetch)
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(_YF_EXECUTOR, _fetch)
+    except Exception as e:
+        raise UpstreamError(str(e)) from e
     if result is None:
-        raise ValueError(f"No data found for ticker {ticker}")
+        raise TickerNotFoundError(f"No data found for ticker {ticker}")
     return result
 
 
+def _build_financials(
+    income: Any, balance: Any, cashflow: Any, timeframe: Optional[str], limit: int
+) -> Dict[str, Any]:
+    """Map the three statement DataFrames to the newest `limit` periods."""
+    freq = (
+        "yearly"
+        if timeframe in (None, "annual")
+        else "quarterly"
+        if timeframe == "quarterly"
+        else "yearly"
+    )
+
+    results: List[Dict[str, Any]] = []
+    income_by_col = _df_to_by_col(income)
+    balance_by_col = _df_to_by_col(balance)
+    cashflow_by_col = _df_to_by_col(cashflow)
+
+    def get_columns(df):
+        if df is None or (hasattr(df, "empty") and df.empty):
+            return []
+        return list(df.columns) if hasattr(df, "columns") else []
+
+    all_cols = set().union(*(get_columns(df) for df in (income, balance, cashflow)))
+
+    if not all_cols:
+        return {"results": []}
+
+    # Only the newest `limit` periods are needed, so avoid sorting them all.
+    sorted_cols = heapq.nlargest(limit, (c for c in all_cols if hasattr(c, "year")))
+
+    for col in sorted_cols:
+        # isoformat is much cheaper than strftime and starts with YYYY-MM-DD
+        end_date = col.isoformat()[:10] if hasattr(col, "isoformat") else str(col)
+        fiscal_year = str(col.year) if hasattr(col, "year") else end_date[:4]
+        fiscal_period = ""
+        if hasattr(col, "month"):
+            fiscal_period = "Q4" if freq == "yearly" else _MONTH_TO_Q[col.month - 1]
+
+        income_stmt = income_by_col.get(col, {})
+        balance_sheet = balance_by_col.get(col, {})
+        cash_flow_stmt = cashflow_by_col.get(col, {})
+
+        results.append(
+            {
+                "start_date": None,
+                "end_date": end_date,
+                "filing_date": None,
+                "timeframe": timeframe or "annual",
+                "fiscal_period": fiscal_period,
+                "fiscal_year": fiscal_year,
+                "financials": {
+                    "income_statement": income_stmt,
+                    "balance_sheet": balance_sheet,
+                    "cash_flow_statement": cash_flow_stmt,
+                },
+            }
+        )
+
+    return {"results": results}
+
+
 async def get_financials(
     ticker: str,
     timeframe: Optional[str] = None,
@@ -146,88 +246,25 @@ async def get_financials(
         Dict with results array matching frontend expectations
     """
 
-    def _fetch():
-        t = yf.Ticker(ticker.upper())
-        freq = (
-            "yearly"
-            if timeframe in (None, "annual")
-            else "quarterly"
-            if timeframe == "quarterly"
-            else "yearly"
-        )
-
-        income = t.income_stmt if hasattr(t, "income_stmt") else None
-        balance = t.balance_sheet if hasattr(t, "balance_sheet") else None
-        cashflow = t.cashflow if hasattr(t, "cashflow") else None
-
-        if timeframe == "ttm":
-            income = getattr(t, "ttm_income_stmt", None) or income
-            balance = getattr(t, "ttm_balance_sheet", None) or balance
-            cashflow = getattr(t, "ttm_cashflow", None) or cashflow
-
-        results: List[Dict[str, Any]] = []
-
-        def get_columns(df):
-            if df is None or (hasattr(df, "empty") and df.empty):
-                return []
-            return list(df.columns) if hasattr(df, "columns") else []
-
-        all_cols = set()
-        for df in (income, balance, cashflow):
-            all_cols.update(get_columns(df))
-
-        if not all_cols:
-            return {"results": []}
-
-        sorted_cols = sorted(
-            [c for c in all_cols if hasattr(c, "year")],
-            key=lambda x: x,
-            reverse=True,
-        )[:limit]
-
-        for col in sorted_cols:
-            end_date = (
-                col.strftime("%Y-%m-%d") if hasattr(col, "strftime") else str(col)
-            )
-            fiscal_year = str(col.year) if hasattr(col, "year") else end_date[:4]
-            fiscal_period = ""
-            if hasattr(col, "month"):
-                q = (col.month - 1) // 3 + 1
-                fiscal_period = "Q4" if freq == "yearly" else f"Q{q}"
-
-            income_stmt = (
-                _series_to_statement(income[col])
-                if income is not None and col in income.columns
-                else {}
-            )
-            balance_sheet = (
-                _series_to_statement(balance[col])
-                if balance is not None and col in balance.columns
-                else {}
-            )
-            cash_flow_stmt = (
-                _series_to_statement(cashflow[col])
-                if cashflow is not None and col in cashflow.columns
-                else {}
-            )
-
-            results.append(
-                {
-                    "start_date": None,
-                    "end_date": end_date,
-                    "filing_date": None,
-                    "timeframe": timeframe or "annual",
-                    "fiscal_period": fiscal_period,
-                    "fiscal_year": fiscal_year,
-                    "financials": {
-                        "income_statement": income_stmt,
-                        "balance_sheet": balance_sheet,
-                        "cash_flow_statement": cash_flow_stmt,
-                    },
-                }
+    # Each statement is a separate Yahoo request, so fetch the three in parallel;
+    # ttm statements fall back to annual ones where Yahoo has none.
+    names = ("income_stmt", "balance_sheet", "cashflow")
+    loop = asyncio.get_running_loop()
+    try:
+        # Ticker() resolves ISINs over the network, so keep it off the event loop.
+        t = await loop.run_in_executor(_YF_EXECUTOR, yf.Ticker, ticker.upper())
+        income, balance, cashflow = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    _YF_EXECUTOR,
+                    _first_statement,
+                    t,
+                    (f"ttm_{name}", name) if timeframe == "ttm" else (name,),
+                )
+                for name in names
             )
-
-        return {"results": results}
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _fetch)
+        )
+        # Statement shapes vary by ticker, so mapping them can fail as well.
+        return _build_financials(income, balance, cashflow, timeframe, limit)
+    except Exception as e:
+        raise UpstreamError(str(e)) from e
@@ -0,0 +1,88 @@
+"""Tests for content negotiation and validators in cached responses."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from app.cache import compress, make_etag
+from app.config import GZIP_MIN_SIZE
+from app.responses import accepts_gzip, cached_response
+
+BODY = b'{"data":"' + b"x" * GZIP_MIN_SIZE + b'"}'
+ETAG = make_etag(BODY)
+GZIP_ETAG = ETAG[:-1] + '-gzip"'
+
+
+@pytest.fixture
+def client() -> TestClient:
+    # Same middleware as create_app, so responses are checked as sent on the wire
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE)
+
+    @app.get("/cached")
+    async def cached(request: Request):
+        return cached_response(request, BODY, ETAG, "HIT", 60, compress(BODY))
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("GZIP; Q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.000", False),
+        ("identity", False),
+        ("br", False),
+        ("", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("deflate, *;q=0.1", True),
+        ("gzip;q=0, *", False),
+        ("x-gzip", False),
+    ],
+)
+def test_accepts_gzip(header: str, expected: bool) -> None:
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding, etag",
+    [
+        ("gzip", "gzip", GZIP_ETAG),
+        ("gzip;q=0", "identity", ETAG),
+        ("identity", "identity", ETAG),
+        ("*;q=0", "identity", ETAG),
+    ],
+)
+def test_representation_and_etag(
+    client: TestClient, accept_encoding: str, encoding: str, etag: str
+) -> None:
+    headers = {"Accept-Encoding": accept_encoding}
+    response = client.get("/cached", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["etag"] == etag
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == BODY
+
+    revalidated = client.get("/cached", headers=headers | {"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, other_etag", [("gzip", ETAG), ("identity", GZIP_ETAG)]
+)
+def test_other_representation_etag_does_not_match(
+    client: TestClient, accept_encoding: str, other_etag: str
+) -> None:
+    response = client.get(
+        "/cached",
+        headers={"Accept-Encoding": accept_encoding, "If-None-Match": other_etag},
+    )
+    assert response.status_code == 200
@@ -0,0 +1,101 @@
+"""Tests for the timer-wheel TTL cache."""
+
+import pytest
+
+from app import timerwheel_cache
+from app.timerwheel_cache import TimerWheelCache
+
+NS = 1_000_000_000
+# One full revolution of the 4-level wheel, in seconds
+REVOLUTION = 64**4
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now_ns = 1_000 * NS
+
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * NS)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(timerwheel_cache, "time", fake)
+    return fake
+
+
+def test_get_respects_ttl(clock: FakeClock) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+    clock.advance(4)
+    assert cache.get("a") == 1
+    clock.advance(2)
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache["b"] == 2
+    assert cache.currsize == 1
+
+
+def test_expire_reclaims_entries(clock: FakeClock) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+    clock.advance(6)
+    cache.expire()
+    assert list(cache) == ["b"]
+    assert cache.currsize == 1
+
+
+@pytest.mark.parametrize("ttl", [100, 5_000, 300_000])
+def test_expire_cascades_higher_levels(clock: FakeClock, ttl: int) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=ttl)
+    cache.set("a", 1)
+    clock.advance(ttl - 1)
+    cache.expire()
+    assert "a" in cache
+    clock.advance(2)
+    cache.expire()
+    assert len(cache) == 0
+    assert cache.currsize == 0
+
+
+def test_overwrite_leaves_old_record_inert(clock: FakeClock) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    cache.set("a", 2, ttl=30)
+    clock.advance(6)
+    cache.expire()
+    assert cache.get("a") == 2
+
+
+def test_evicts_least_recently_used_by_size(clock: FakeClock) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=60, getsizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.get("a")
+    cache.set("c", "xxxx")
+    assert list(cache) == ["a", "c"]
+    assert cache.currsize == 8
+    # A value larger than the whole cache is not stored and evicts nothing
+    cache.set("d", "x" * 11)
+    assert "d" not in cache
+    assert cache.currsize == 8
+
+
+def test_expire_rebuilds_after_full_revolution(clock: FakeClock) -> None:
+    cache = TimerWheelCache(maxsize=10, ttl=10)
+    cache.set("short", 1)
+    cache.set("long", 2, ttl=2 * REVOLUTION)
+    clock.advance(REVOLUTION + 1)
+    cache.expire()
+    assert list(cache) == ["long"]
+    assert cache.currsize == 1
+    assert cache._tick == clock.now_ns // NS + 1
+    clock.advance(64)
+    cache.expire()
+    assert cache.get("long") == 2
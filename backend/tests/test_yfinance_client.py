@@ -0,0 +1,88 @@
+"""Tests for the yfinance response mapping helpers."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.yfinance_client import _df_to_by_col, _safe_float, _to_snake
+
+Q3 = pd.Timestamp("2024-09-30")
+Q2 = pd.Timestamp("2024-06-30")
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("Total Revenue", "total__revenue"),
+        ("EBITDA", "ebitda"),
+        ("EBIT", "ebit"),
+        ("Net PPE", "net_ppe"),
+        ("Diluted EPS", "diluted_eps"),
+        ("TotalDebt", "total_debt"),
+        ("NetIncomeFromContinuingOperations", "net_income_from_continuing_operations"),
+        ("Cash-Flow", "cash__flow"),
+    ],
+)
+def test_to_snake(label: str, expected: str) -> None:
+    assert _to_snake(label) == expected
+
+
+@pytest.mark.parametrize(
+    "val, expected",
+    [
+        (np.float64(1.5), 1.5),
+        (np.float32(2.5), 2.5),
+        (np.int64(3), 3.0),
+        (7, 7.0),
+        ("4.5", 4.5),
+        (np.nan, None),
+        (np.float64("inf"), None),
+        (-math.inf, None),
+        (pd.NA, None),
+        (None, None),
+        ("abc", None),
+    ],
+)
+def test_safe_float(val, expected) -> None:
+    result = _safe_float(val)
+    assert result == expected
+    if expected is not None:
+        assert type(result) is float
+
+
+def _item(value: float, label: str) -> dict:
+    return {"value": value, "unit": "USD", "label": label}
+
+
+def test_df_to_by_col_skips_missing_and_non_numeric_cells() -> None:
+    df = pd.DataFrame(
+        {
+            Q3: [1.0, np.nan, "12", np.int64(5)],
+            Q2: ["n/a", math.inf, None, 4.0],
+        },
+        index=["Total Revenue", "EBITDA", "Gross Profit", "NetIncome"],
+        dtype=object,
+    )
+    assert _df_to_by_col(df) == {
+        Q3: {
+            "total__revenue": _item(1.0, "Total Revenue"),
+            "gross__profit": _item(12.0, "Gross Profit"),
+            "net_income": _item(5.0, "NetIncome"),
+        },
+        Q2: {"net_income": _item(4.0, "NetIncome")},
+    }
+
+
+def test_df_to_by_col_keeps_last_finite_duplicate_label() -> None:
+    df = pd.DataFrame({Q3: [1.0, 2.0], Q2: [3.0, np.nan]}, index=["Total Revenue"] * 2)
+    assert _df_to_by_col(df) == {
+        Q3: {"total__revenue": _item(2.0, "Total Revenue")},
+        Q2: {"total__revenue": _item(3.0, "Total Revenue")},
+    }
+
+
+def test_df_to_by_col_empty() -> None:
+    assert _df_to_by_col(None) == {}
+    assert _df_to_by_col(pd.DataFrame()) == {}